@@ -1,8 +1,10 @@
 """This platform allows several climate devices to be grouped into one climate device."""
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from itertools import chain
 import logging
-from statistics import mean
 from typing import Any
 
 import voluptuous as vol
@@ -46,19 +48,14 @@ from homeassistant.const import (
     CONF_UNIQUE_ID,
     STATE_UNAVAILABLE,
 )
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from homeassistant.components.group import GroupEntity
-from homeassistant.components.group.util import (
-    find_state_attributes,
-    most_frequent_attribute,
-    reduce_attribute,
-    states_equal,
-)
+from homeassistant.components.group.util import states_equal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +81,35 @@ SUPPORT_FLAGS = (
     | ClimateEntityFeature.FAN_MODE
 )
 
+# Member attributes the group state is derived from
+GROUP_ATTRIBUTES = (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_FAN_MODE,
+    ATTR_FAN_MODES,
+    ATTR_HVAC_ACTION,
+    ATTR_HVAC_MODES,
+    ATTR_MAX_TEMP,
+    ATTR_MIN_TEMP,
+    ATTR_PRESET_MODE,
+    ATTR_PRESET_MODES,
+    ATTR_SUPPORTED_FEATURES,
+    ATTR_SWING_MODE,
+    ATTR_SWING_MODES,
+    ATTR_TARGET_TEMP_HIGH,
+    ATTR_TARGET_TEMP_LOW,
+    ATTR_TARGET_TEMP_STEP,
+    ATTR_TEMPERATURE,
+)
+
+# Member attributes the group reports the mean of
+MEAN_ATTRIBUTES = (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_TARGET_TEMP_HIGH,
+    ATTR_TARGET_TEMP_LOW,
+    ATTR_TEMPERATURE,
+)
+
+
 async def async_setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
@@ -128,6 +154,39 @@ async def async_setup_entry(
     )
 
 
+def _mean(total: float, count: int) -> float | None:
+    """Return the mean of count values adding up to total."""
+    if not count:
+        return None
+    # A single value is reported as is, like reduce_attribute does
+    if count == 1:
+        return total
+    return total / count
+
+
+def _merge_modes(mode_lists: list[list[str]]) -> list[str]:
+    """Merge mode lists, keeping each mode in the order it is first seen."""
+    return list(dict.fromkeys(chain.from_iterable(mode_lists)))
+
+
+def _most_common(counts: Counter[str]) -> str | None:
+    """Return the most common value of a tally, or None if it is empty."""
+    return counts.most_common(1)[0][0] if counts else None
+
+
+def _relevant_changed(old_state: State | None, new_state: State | None) -> bool:
+    """Return True if a member change can affect the group state."""
+    if old_state is None or new_state is None:
+        return True
+    if old_state.state != new_state.state:
+        return True
+    old_attrs = old_state.attributes
+    new_attrs = new_state.attributes
+    return any(
+        old_attrs.get(attr) != new_attrs.get(attr) for attr in GROUP_ATTRIBUTES
+    )
+
+
 class ClimateGroup(GroupEntity, ClimateEntity):
     """Representation of a climate group."""
 
@@ -165,134 +224,198 @@ class ClimateGroup(GroupEntity, ClimateEntity):
         self._attr_preset_modes = None
         self._attr_preset_mode = None
 
+        # Pending coalesced update, see async_added_to_hass
+        self._update_handle: asyncio.Handle | None = None
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
 
         @callback
         def async_state_changed_listener(event: Event) -> None:
             """Handle child updates."""
+            if not _relevant_changed(
+                event.data.get("old_state"), event.data.get("new_state")
+            ):
+                return
             self.async_set_context(event.context)
-            self.async_defer_or_update_ha_state()
+            # Members changing in the same loop iteration (e.g. after a
+            # forwarded service call) only trigger a single update.
+            if self._update_handle is None:
+                self._update_handle = self.hass.loop.call_soon(
+                    self._async_scheduled_update
+                )
 
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass, self._entity_ids, async_state_changed_listener
             )
         )
+        self.async_on_remove(self._async_cancel_scheduled_update)
 
         await super().async_added_to_hass()
 
+    @callback
+    def _async_scheduled_update(self) -> None:
+        """Update the group state once for a burst of child updates."""
+        self._update_handle = None
+        self.async_defer_or_update_ha_state()
+
+    @callback
+    def _async_cancel_scheduled_update(self) -> None:
+        """Cancel a pending group state update."""
+        if self._update_handle is not None:
+            self._update_handle.cancel()
+            self._update_handle = None
+
     @callback
     def async_update_group_state(self) -> None:
         """Query all members and determine the climate group state."""
-        self._attr_assumed_state = False
-
+        states_get = self.hass.states.get
         states = [
-            state
-            for entity_id in self._entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
+            state for state in map(states_get, self._entity_ids) if state is not None
         ]
-        self._attr_assumed_state |= not states_equal(states)
+        # A single member always agrees with itself
+        self._attr_assumed_state = len(states) > 1 and not states_equal(states)
 
         # Set group as unavailable if all members are unavailable or missing
         self._attr_available = any(state.state != STATE_UNAVAILABLE for state in states)
 
-        # Temperature settings
-        self._attr_target_temperature = reduce_attribute(
-            states, ATTR_TEMPERATURE, reduce=lambda *data: mean(data)
-        )
+        # Aggregate all member attributes in a single pass
+        temperature_sums = dict.fromkeys(MEAN_ATTRIBUTES, 0)
+        temperature_counts = dict.fromkeys(MEAN_ATTRIBUTES, 0)
+        target_temperature_step = None
+        min_temp = None
+        max_temp = None
+
+        hvac_mode_counts: Counter[str] = Counter()
+        hvac_action_counts: Counter[str] = Counter()
+        fan_mode_counts: Counter[str] = Counter()
+        swing_mode_counts: Counter[str] = Counter()
+        preset_mode_counts: Counter[str] = Counter()
+
+        hvac_mode_lists: list[list[str]] = []
+        fan_mode_lists: list[list[str]] = []
+        swing_mode_lists: list[list[str]] = []
+        preset_mode_lists: list[list[str]] = []
+
+        supported_features = 0
+
+        for state in states:
+            # count the hvac modes (what the thermostat is set to do) except OFF
+            if state.state != HVACMode.OFF:
+                hvac_mode_counts[state.state] += 1
+
+            attrs_get = state.attributes.get
+
+            for attr in MEAN_ATTRIBUTES:
+                if (value := attrs_get(attr)) is not None:
+                    temperature_sums[attr] += value
+                    temperature_counts[attr] += 1
+
+            if (value := attrs_get(ATTR_TARGET_TEMP_STEP)) is not None and (
+                target_temperature_step is None or value > target_temperature_step
+            ):
+                target_temperature_step = value
+            if (value := attrs_get(ATTR_MIN_TEMP)) is not None and (
+                min_temp is None or value > min_temp
+            ):
+                min_temp = value
+            if (value := attrs_get(ATTR_MAX_TEMP)) is not None and (
+                max_temp is None or value < max_temp
+            ):
+                max_temp = value
+
+            if (value := attrs_get(ATTR_HVAC_ACTION)) is not None and (
+                value != HVACAction.OFF
+            ):
+                hvac_action_counts[value] += 1
+            if (value := attrs_get(ATTR_FAN_MODE)) is not None:
+                fan_mode_counts[value] += 1
+            if (value := attrs_get(ATTR_SWING_MODE)) is not None:
+                swing_mode_counts[value] += 1
+            if (value := attrs_get(ATTR_PRESET_MODE)) is not None:
+                preset_mode_counts[value] += 1
+
+            # Collect all mode lists, they are merged after the loop
+            if value := attrs_get(ATTR_HVAC_MODES):
+                hvac_mode_lists.append(value)
+            if value := attrs_get(ATTR_FAN_MODES):
+                fan_mode_lists.append(value)
+            if value := attrs_get(ATTR_SWING_MODES):
+                swing_mode_lists.append(value)
+            if value := attrs_get(ATTR_PRESET_MODES):
+                preset_mode_lists.append(value)
 
-        self._attr_target_temperature_step = reduce_attribute(
-            states, ATTR_TARGET_TEMP_STEP, reduce=max
-        )
-
-        self._attr_target_temperature_low = reduce_attribute(
-            states, ATTR_TARGET_TEMP_LOW, reduce=lambda *data: mean(data)
-        )
-        self._attr_target_temperature_high = reduce_attribute(
-            states, ATTR_TARGET_TEMP_HIGH, reduce=lambda *data: mean(data)
-        )
-
-        self._attr_current_temperature = reduce_attribute(
-            states, ATTR_CURRENT_TEMPERATURE, reduce=lambda *data: mean(data)
-        )
+            # Merge supported features by emulating support for every feature
+            # we find.
+            if (value := attrs_get(ATTR_SUPPORTED_FEATURES)) is not None:
+                supported_features |= value
 
-        self._attr_min_temp = reduce_attribute(states, ATTR_MIN_TEMP, reduce=max)
-        self._attr_max_temp = reduce_attribute(states, ATTR_MAX_TEMP, reduce=min)
+        # Temperature settings
+        temperatures = {
+            attr: _mean(temperature_sums[attr], count)
+            for attr, count in temperature_counts.items()
+        }
+        self._attr_target_temperature = temperatures[ATTR_TEMPERATURE]
+        self._attr_target_temperature_low = temperatures[ATTR_TARGET_TEMP_LOW]
+        self._attr_target_temperature_high = temperatures[ATTR_TARGET_TEMP_HIGH]
+        self._attr_current_temperature = temperatures[ATTR_CURRENT_TEMPERATURE]
+
+        self._attr_target_temperature_step = target_temperature_step
+        self._attr_min_temp = min_temp
+        self._attr_max_temp = max_temp
         # End temperature settings
 
         # available HVAC modes
-        all_hvac_modes = list(find_state_attributes(states, ATTR_HVAC_MODES))
-        if all_hvac_modes:
-            # Merge all effects from all effect_lists with a union merge.
-            self._attr_hvac_modes = list(set().union(*all_hvac_modes))
-
-        
-        current_hvac_modes = [x.state for x in states if x.state != HVACMode.OFF]
-        # return the most common hvac mode (what the thermostat is set to do) except OFF
-        if current_hvac_modes:
-            self._attr_hvac_mode = max(set(current_hvac_modes), key=current_hvac_modes.count)
+        if hvac_mode_lists:
+            self._attr_hvac_modes = _merge_modes(hvac_mode_lists)
+
+        # return the most common hvac mode except OFF
+        if hvac_mode_counts:
+            self._attr_hvac_mode = _most_common(hvac_mode_counts)
         # return off if all are off
-        elif all(x.state == HVACMode.OFF for x in states):
-            self._attr_preset_mode = HVACMode.OFF
-        # else it's none
+        elif states:
+            self._attr_hvac_mode = HVACMode.OFF
+        # else there are no members to report
         else:
             self._attr_hvac_mode = None
 
-        # return the most common action if it is not off
-        hvac_actions = list(find_state_attributes(states, ATTR_HVAC_ACTION))
-        current_hvac_actions = [a for a in hvac_actions if a != HVACAction.OFF]
-        # return the most common action if it is not off
-        if current_hvac_actions:
-            self._attr_hvac_action = max(set(current_hvac_actions), key=current_hvac_actions.count)
-        # return action off if all are off
-        elif all(a == HVACAction.OFF for a in hvac_actions):
-            self._attr_hvac_action = HVACAction.OFF
-        # else it's none
+        # return the most common action if it is not off, off if all are off
+        if hvac_action_counts:
+            self._attr_hvac_action = _most_common(hvac_action_counts)
         else:
-            self._attr_hvac_action = None
+            self._attr_hvac_action = HVACAction.OFF
 
         # available swing modes
-        all_swing_modes = list(find_state_attributes(states, ATTR_SWING_MODES))
-        if all_swing_modes:
-            self._attr_swing_modes = list(set().union(*all_swing_modes))
+        if swing_mode_lists:
+            self._attr_swing_modes = _merge_modes(swing_mode_lists)
 
         # Report the most common swing_mode.
-        self._attr_swing_mode = most_frequent_attribute(states, ATTR_SWING_MODE)
+        self._attr_swing_mode = _most_common(swing_mode_counts)
 
         # available fan modes
-        all_fan_modes = list(find_state_attributes(states, ATTR_FAN_MODES))
-        if all_fan_modes:
-            # Merge all effects from all effect_lists with a union merge.
-            self._attr_fan_modes = list(set().union(*all_fan_modes))
+        if fan_mode_lists:
+            self._attr_fan_modes = _merge_modes(fan_mode_lists)
 
         # Report the most common fan_mode.
-        self._attr_fan_mode = most_frequent_attribute(states, ATTR_FAN_MODE)
+        self._attr_fan_mode = _most_common(fan_mode_counts)
 
         # available preset modes
-        all_preset_modes = list(find_state_attributes(states, ATTR_PRESET_MODES))
-        if all_preset_modes:
-            # Merge all effects from all effect_lists with a union merge.
-            self._attr_preset_modes = list(set().union(*all_preset_modes))
+        if preset_mode_lists:
+            self._attr_preset_modes = _merge_modes(preset_mode_lists)
 
-        # Report the most common fan_mode.
-        self._attr_preset_mode = most_frequent_attribute(states, ATTR_PRESET_MODE)
-
-        # Supported flags
-        for support in find_state_attributes(states, ATTR_SUPPORTED_FEATURES):
-            # Merge supported features by emulating support for every feature
-            # we find.
-            self._attr_supported_features |= support
+        # Report the most common preset_mode.
+        self._attr_preset_mode = _most_common(preset_mode_counts)
 
         # Bitwise-and the supported features with the Grouped climate's features
         # so that we don't break in the future when a new feature is added.
-        self._attr_supported_features &= SUPPORT_FLAGS
+        self._attr_supported_features = supported_features & SUPPORT_FLAGS
 
         _LOGGER.debug("State update complete")
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Forward the turn_on command to all climate in the climate group."""
-        data = {ATTR_ENTITY_ID: self._entity_ids}
+        data = {}
 
         if ATTR_HVAC_MODE in kwargs:
             _LOGGER.debug("Set temperature with HVAC MODE")
@@ -305,48 +428,36 @@ class ClimateGroup(GroupEntity, ClimateEntity):
         if ATTR_TARGET_TEMP_HIGH in kwargs:
             data[ATTR_TARGET_TEMP_HIGH] = kwargs[ATTR_TARGET_TEMP_HIGH]
 
-        _LOGGER.debug("Setting temperature: %s", data)
+        # Nothing left to forward if only the hvac mode was set
+        if not data:
+            return
 
-        await self.hass.services.async_call(
-            DOMAIN, SERVICE_SET_TEMPERATURE, data, blocking=True, context=self._context
-        )
+        await self._async_forward(SERVICE_SET_TEMPERATURE, data)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Forward the turn_on command to all climate in the climate group."""
-        data = {ATTR_ENTITY_ID: self._entity_ids, ATTR_HVAC_MODE: hvac_mode}
-        _LOGGER.debug("Setting hvac mode: %s", data)
-        await self.hass.services.async_call(
-            DOMAIN, SERVICE_SET_HVAC_MODE, data, blocking=True, context=self._context
-        )
+        await self._async_forward(SERVICE_SET_HVAC_MODE, {ATTR_HVAC_MODE: hvac_mode})
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Forward the fan_mode to all climate in the climate group."""
-        data = {ATTR_ENTITY_ID: self._entity_ids, ATTR_FAN_MODE: fan_mode}
-        _LOGGER.debug("Setting fan mode: %s", data)
-        await self.hass.services.async_call(
-            DOMAIN, SERVICE_SET_FAN_MODE, data, blocking=True, context=self._context
-        )
+        await self._async_forward(SERVICE_SET_FAN_MODE, {ATTR_FAN_MODE: fan_mode})
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Forward the swing_mode to all climate in the climate group."""
-        data = {ATTR_ENTITY_ID: self._entity_ids, ATTR_SWING_MODE: swing_mode}
-        _LOGGER.debug("Setting swing mode: %s", data)
-        await self.hass.services.async_call(
-            DOMAIN,
-            SERVICE_SET_SWING_MODE,
-            data,
-            blocking=True,
-            context=self._context,
+        await self._async_forward(
+            SERVICE_SET_SWING_MODE, {ATTR_SWING_MODE: swing_mode}
         )
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Forward the preset_mode to all climate in the climate group."""
-        data = {ATTR_ENTITY_ID: self._entity_ids, ATTR_PRESET_MODE: preset_mode}
-        _LOGGER.debug("Setting preset mode: %s", data)
+        await self._async_forward(
+            SERVICE_SET_PRESET_MODE, {ATTR_PRESET_MODE: preset_mode}
+        )
+
+    async def _async_forward(self, service: str, data: dict[str, Any]) -> None:
+        """Call a climate service on all members of the climate group."""
+        data[ATTR_ENTITY_ID] = self._entity_ids
+        _LOGGER.debug("Forwarding %s: %s", service, data)
         await self.hass.services.async_call(
-            DOMAIN,
-            SERVICE_SET_PRESET_MODE,
-            data,
-            blocking=True,
-            context=self._context,
+            DOMAIN, service, data, blocking=True, context=self._context
         )